@@ -9,27 +9,183 @@ Adaptive interface that detects environment and optimizes accordingly:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk
 import subprocess
 import os
 import sys
 import threading
+import queue
 import time
 import platform
-import glob
 import json
+import socket
+import shutil
+import functools
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(APP_DIR, 'scripts')
+CONFIG_DIR = os.path.expanduser('~/.config/hamster')
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
+
+ICON_PATHS = [
+    os.path.join(APP_DIR, 'docs', 'hamster-icon.png'),
+    os.path.join(APP_DIR, 'docs', 'icon.png'),
+    '/usr/share/icons/hicolor/64x64/apps/hamster.png'
+]
+
+# How long probe results are reused before running the command again (seconds)
+SERVICE_STATUS_TTL = 10
+SYSTEM_INFO_TTL = 60
+PRIMARY_IP_TTL = 5
+
+# (checked_at, ip) from the last primary IP lookup
+_primary_ip_cache = (None, None)
+
+
+def read_proc_file(path, size=8192):
+    """Read a small procfs/sysfs file with a single read() into a fixed buffer"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name):
+    """Locate an executable on PATH in-process, remembering the answer"""
+    return shutil.which(name)
+
+
+def get_primary_ip():
+    """Return the IPv4 address of the interface holding the default route"""
+    global _primary_ip_cache
+    now = time.monotonic()
+    checked_at, ip = _primary_ip_cache
+    if checked_at is not None and now - checked_at < PRIMARY_IP_TTL:
+        return ip
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Connecting a UDP socket sends nothing; it only picks a route
+        sock.connect(('10.255.255.255', 1))
+        ip = sock.getsockname()[0]
+    except OSError:
+        ip = None
+    finally:
+        sock.close()
+    
+    _primary_ip_cache = (now, ip)
+    return ip
+
+
+class CachedRunner:
+    """Shared subprocess runner that reuses recent results for a TTL"""
+    
+    def __init__(self, timeout=5):
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    def run(self, argv, ttl=5):
+        """Run one command, or return its cached result if younger than ttl"""
+        key = tuple(argv)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and now - cached[0] < ttl:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        
+        # Only stdout is read, so stdin and stderr go to /dev/null rather than getting pipes
+        try:
+            proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                                    stdin=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+        except OSError:
+            return subprocess.CompletedProcess(argv, 127, '')
+        
+        try:
+            stdout, _ = proc.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            stdout, _ = proc.communicate()
+        
+        # The pipe is read as bytes and decoded once, skipping the text wrapper
+        result = subprocess.CompletedProcess(argv, proc.returncode,
+                                             stdout.decode('utf-8', 'replace'))
+        with self._lock:
+            self._cache[key] = (now, result)
+        return result
+    
+    def invalidate(self, argv=None):
+        """Forget one cached command, or all of them"""
+        with self._lock:
+            if argv is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(tuple(argv), None)
+
+
 class EnvironmentDetector:
     """Detect system environment and capabilities"""
     
+    # Environment type does not change while we run, so probe procfs once
+    _environment = None
+    
+    # Shared instance handed out by get()
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls):
+        """Return the process-wide detector, probing the system on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop cached results so the next get() probes again (e.g. on hotplug)"""
+        with cls._instance_lock:
+            cls._instance = None
+            cls._environment = None
+    
     def __init__(self):
-        self.environment = self.detect_environment()
-        self.input_methods = self.detect_input_methods()
-        self.screen_info = self.detect_screen_info()
+        # procfs and udev probes are independent, so let them overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            environment = executor.submit(self.detect_environment)
+            input_methods = executor.submit(self.detect_input_methods)
+            self.environment = environment.result()
+            self.input_methods = input_methods.result()
+        
+        # Filled in by detect_screen() once a Tk root exists
+        self.screen_info = None
+    
+    def detect_screen(self, root):
+        """Detect screen info; must run on the thread that owns the Tk root"""
+        self.screen_info = self.detect_screen_info(root,
+                                                   self.input_methods['touchscreen'],
+                                                   self.environment['is_pi'])
+        return self.screen_info
         
     def detect_environment(self):
         """Detect the type of Linux environment"""
+        if EnvironmentDetector._environment is not None:
+            return dict(EnvironmentDetector._environment)
+        
         env = {
             'type': 'unknown',
             'is_pi': False,
@@ -41,10 +197,10 @@ class EnvironmentDetector:
         
         # Check if Raspberry Pi
         try:
-            with open('/proc/cpuinfo', 'r') as f:
-                if 'BCM' in f.read() or 'Raspberry' in f.read():
-                    env['is_pi'] = True
-                    env['type'] = 'raspberry_pi'
+            cpuinfo = read_proc_file('/proc/cpuinfo')
+            if b'BCM' in cpuinfo or b'Raspberry' in cpuinfo:
+                env['is_pi'] = True
+                env['type'] = 'raspberry_pi'
         except:
             pass
         
@@ -58,11 +214,10 @@ class EnvironmentDetector:
         
         # Check if running on gaming console (common characteristics)
         try:
-            with open('/proc/device-tree/model', 'r') as f:
-                model = f.read().lower()
-                if any(console in model for console in ['rg', 'anbernic', 'powkiddy', 'retroid']):
-                    env['is_console'] = True
-                    env['type'] = 'gaming_console'
+            model = read_proc_file('/proc/device-tree/model').lower()
+            if any(console in model for console in [b'rg', b'anbernic', b'powkiddy', b'retroid']):
+                env['is_console'] = True
+                env['type'] = 'gaming_console'
         except:
             pass
         
@@ -78,7 +233,8 @@ class EnvironmentDetector:
             else:
                 env['type'] = 'minimal_linux'
         
-        return env
+        EnvironmentDetector._environment = env
+        return dict(env)
     
     def detect_input_methods(self):
         """Detect available input methods"""
@@ -90,34 +246,56 @@ class EnvironmentDetector:
             'joystick_devices': []
         }
         
-        # Check for touchscreen
-        try:
-            touch_devices = glob.glob('/dev/input/event*')
-            for device in touch_devices:
-                try:
-                    # Check device capabilities
-                    result = subprocess.run(['udevadm', 'info', '--query=property', f'--name={device}'], 
-                                          capture_output=True, text=True)
-                    if 'ID_INPUT_TOUCHSCREEN=1' in result.stdout:
+        if pyudev is not None:
+            # Single pass over udev's cached device properties
+            try:
+                for device in pyudev.Context().list_devices(subsystem='input'):
+                    props = device.properties
+                    name = device.sys_name
+                    if props.get('ID_INPUT_TOUCHSCREEN') == '1':
                         methods['touchscreen'] = True
-                        break
-                except:
-                    pass
-        except:
-            pass
-        
-        # Check for mouse
-        methods['mouse'] = len(glob.glob('/dev/input/mouse*')) > 0
+                    if props.get('ID_INPUT_MOUSE') == '1' and name.startswith('mouse'):
+                        methods['mouse'] = True
+                    if props.get('ID_INPUT_JOYSTICK') == '1' and name.startswith('js'):
+                        methods['joystick_devices'].append(device.device_node)
+            except:
+                pass
+        else:
+            # One directory scan, bucketed by device node name
+            event_devices = []
+            try:
+                with os.scandir('/dev/input') as entries:
+                    for entry in entries:
+                        if entry.name.startswith('event'):
+                            event_devices.append(entry.name)
+                        elif entry.name.startswith('mouse'):
+                            methods['mouse'] = True
+                        elif entry.name.startswith('js'):
+                            methods['joystick_devices'].append(entry.path)
+            except:
+                pass
+            methods['touchscreen'] = self.udev_db_has_touchscreen(event_devices)
         
         # Check for gamepad/joystick
-        joystick_devices = glob.glob('/dev/input/js*')
-        methods['gamepad'] = len(joystick_devices) > 0
-        methods['joystick_devices'] = joystick_devices
+        methods['gamepad'] = len(methods['joystick_devices']) > 0
         
         return methods
     
-    def detect_screen_info(self):
-        """Detect screen resolution and DPI"""
+    def udev_db_has_touchscreen(self, event_devices):
+        """Look for a touchscreen in udev's database without pyudev"""
+        for name in event_devices:
+            try:
+                with open(f'/sys/class/input/{name}/dev', 'r') as f:
+                    dev = f.read().strip()
+                with open(f'/run/udev/data/c{dev}', 'r') as f:
+                    if 'E:ID_INPUT_TOUCHSCREEN=1' in f.read():
+                        return True
+            except:
+                pass
+        return False
+    
+    def detect_screen_info(self, root=None, touchscreen=False, is_pi=False):
+        """Detect screen resolution and DPI from the Tk root, if there is one"""
         info = {
             'width': 1024,
             'height': 768,
@@ -126,28 +304,12 @@ class EnvironmentDetector:
             'is_touch_optimized': False
         }
         
-        try:
-            # Try to get screen info from xrandr
-            result = subprocess.run(['xrandr'], capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if ' connected primary' in line or ' connected ' in line:
-                    parts = line.split()
-                    for part in parts:
-                        if 'x' in part and '+' in part:
-                            resolution = part.split('+')[0]
-                            if 'x' in resolution:
-                                width, height = map(int, resolution.split('x'))
-                                info['width'] = width
-                                info['height'] = height
-                                break
-                    break
-        except:
-            # Fallback to tkinter detection
+        # Never open a Tk connection just to measure; without a root keep defaults
+        if root is not None:
             try:
-                root = tk.Tk()
                 info['width'] = root.winfo_screenwidth()
                 info['height'] = root.winfo_screenheight()
-                root.destroy()
+                info['dpi'] = round(root.winfo_fpixels('1i'))
             except:
                 pass
         
@@ -155,18 +317,112 @@ class EnvironmentDetector:
         info['is_small_screen'] = info['width'] <= 800 or info['height'] <= 480
         
         # Touch optimization heuristic
-        info['is_touch_optimized'] = (self.input_methods['touchscreen'] and 
-                                     info['is_small_screen']) or self.environment['is_pi']
+        info['is_touch_optimized'] = (touchscreen and info['is_small_screen']) or is_pi
         
         return info
 
 
 class AdaptiveHamsterGUI:
+    DARK_COLORS = {
+        'bg_primary': '#2c3e50',
+        'bg_secondary': '#34495e',
+        'fg_primary': '#ecf0f1',
+        'fg_secondary': '#bdc3c7',
+        'accent': '#3498db',
+        'success': '#27ae60',
+        'warning': '#f39c12',
+        'error': '#e74c3c'
+    }
+    
+    LIGHT_COLORS = {
+        'bg_primary': '#ffffff',
+        'bg_secondary': '#f8f9fa',
+        'fg_primary': '#212529',
+        'fg_secondary': '#6c757d',
+        'accent': '#007bff',
+        'success': '#28a745',
+        'warning': '#ffc107',
+        'error': '#dc3545'
+    }
+    
+    # Icon that loaded successfully, reused by later windows
+    _icon_path = None
+    
     def __init__(self):
-        self.detector = EnvironmentDetector()
         self.config = self.load_config()
+        self.runner = CachedRunner()
+        self._uname = os.uname()
+        
+        # Last status shown, and when it was last requested, for debouncing
+        self._last_status = None
+        self._status_states = {}
+        self._last_status_check = 0.0
+        self._refresh_pending = False
+        
+        # Secondary windows are built on first open, then hidden and reused
+        self._quick_menu = None
+        self._settings_window = None
+        self._system_info_window = None
+        
+        # Open modal windows, topmost last; only the top one holds the grab
+        self._modal_stack = []
+        
+        # First terminal emulator found, resolved on first script run
+        self._terminal = None
+        
+        # Status polls run on one persistent worker fed through this queue
+        self._status_queue = queue.Queue()
+        threading.Thread(target=self.status_worker, daemon=True).start()
         
         self.root = tk.Tk()
+        self.root.title("Hamster - Ham Radio Manager")
+        self.show_detecting_placeholder()
+        
+        # Probe the system once the placeholder has been painted
+        self.root.after_idle(self.start_background_detection)
+    
+    def show_detecting_placeholder(self):
+        """Show a placeholder while the environment is being detected"""
+        self.placeholder = tk.Label(self.root,
+                                    text="🔊 HAMSTER\n\nDetecting environment...",
+                                    font=('Arial', 14))
+        self.placeholder.pack(expand=True, padx=40, pady=40)
+    
+    def start_background_detection(self):
+        """Run the blocking system probes off the Tk thread"""
+        threading.Thread(target=self.detect_in_background, daemon=True).start()
+    
+    def detect_in_background(self):
+        """Worker thread: probe the system and hand results to the Tk thread"""
+        try:
+            detector = EnvironmentDetector.get()
+        except Exception as e:
+            traceback.print_exc()
+            # Pass the error itself; the name e is unbound once this block exits
+            self.root.after(0, self.detection_failed, e)
+            return
+        self.root.after(0, lambda: self.apply_detection(detector))
+    
+    def detection_failed(self, error):
+        """Report a failed environment probe instead of waiting on the placeholder"""
+        self.show_error("Hamster", f"Failed to detect the system environment:\n{error}")
+        self.root.destroy()
+    
+    def apply_detection(self, detector):
+        """Build the adaptive UI once detection results are available"""
+        self.detector = detector
+        self.detector.detect_screen(self.root)
+        self.placeholder.destroy()
+        
+        # Input methods and screen are fixed for the process lifetime
+        self._help_text = self.get_adaptive_help_text()
+        self._sysinfo_prefix = (
+            f"Environment: {detector.environment['type']}\n"
+            f"Screen: {detector.screen_info['width']}x{detector.screen_info['height']}\n"
+            f"Touch: {'Yes' if detector.input_methods['touchscreen'] else 'No'}\n"
+            f"Gamepad: {'Yes' if detector.input_methods['gamepad'] else 'No'}\n"
+        )
+        
         self.setup_window()
         self.setup_styles()
         self.create_widgets()
@@ -178,7 +434,6 @@ class AdaptiveHamsterGUI:
         
     def load_config(self):
         """Load user configuration or create default"""
-        config_file = os.path.expanduser('~/.config/hamster/config.json')
         default_config = {
             'station': {
                 'callsign': 'N0CALL',
@@ -193,10 +448,12 @@ class AdaptiveHamsterGUI:
             }
         }
         
+        self._config_dir_ready = False
         try:
-            os.makedirs(os.path.dirname(config_file), exist_ok=True)
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+            self._config_dir_ready = True
+            if os.path.exists(CONFIG_FILE):
+                with open(CONFIG_FILE, 'r') as f:
                     config = json.load(f)
                 # Merge with defaults for missing keys
                 for key in default_config:
@@ -204,21 +461,28 @@ class AdaptiveHamsterGUI:
                         config[key] = default_config[key]
                 return config
             else:
-                with open(config_file, 'w') as f:
-                    json.dump(default_config, f, indent=2)
+                self.write_config_file(default_config)
                 return default_config
         except:
             return default_config
     
     def save_config(self):
         """Save current configuration"""
-        config_file = os.path.expanduser('~/.config/hamster/config.json')
         try:
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if not self._config_dir_ready:
+                os.makedirs(CONFIG_DIR, exist_ok=True)
+                self._config_dir_ready = True
+            self.write_config_file(self.config)
         except Exception as e:
             print(f"Failed to save config: {e}")
     
+    def write_config_file(self, config):
+        """Write config atomically so a crash mid-write cannot truncate it"""
+        tmp_file = CONFIG_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_file, CONFIG_FILE)
+    
     def setup_window(self):
         """Setup window based on detected environment"""
         self.root.title("Hamster - Ham Radio Manager")
@@ -258,24 +522,17 @@ class AdaptiveHamsterGUI:
         # Set window icon if available
         self.setup_window_icon()
         
-        # Configure window based on capabilities
-        self.root.configure(bg=self.get_theme_color('bg_primary'))
-        
     def setup_window_icon(self):
         """Set window icon if available"""
-        icon_paths = [
-            os.path.join(os.path.dirname(__file__), 'docs', 'hamster-icon.png'),
-            os.path.join(os.path.dirname(__file__), 'docs', 'icon.png'),
-            '/usr/share/icons/hicolor/64x64/apps/hamster.png'
-        ]
-        
+        # PhotoImage fails on a missing file, so no separate stat is needed
+        icon_paths = [self._icon_path] if self._icon_path else ICON_PATHS
         for icon_path in icon_paths:
-            if os.path.exists(icon_path):
-                try:
-                    self.root.iconphoto(True, tk.PhotoImage(file=icon_path))
-                    break
-                except:
-                    pass
+            try:
+                self.root.iconphoto(True, tk.PhotoImage(file=icon_path))
+                AdaptiveHamsterGUI._icon_path = icon_path
+                break
+            except tk.TclError:
+                continue
     
     def center_window(self):
         """Center window on screen"""
@@ -286,41 +543,14 @@ class AdaptiveHamsterGUI:
     
     def get_theme_color(self, element):
         """Get theme color based on environment"""
-        # Dark theme for gaming consoles and small screens
-        if self.window_mode in ['fullscreen_console', 'touchscreen']:
-            colors = {
-                'bg_primary': '#2c3e50',
-                'bg_secondary': '#34495e',
-                'fg_primary': '#ecf0f1',
-                'fg_secondary': '#bdc3c7',
-                'accent': '#3498db',
-                'success': '#27ae60',
-                'warning': '#f39c12',
-                'error': '#e74c3c'
-            }
-        else:
-            # Light theme for desktop
-            colors = {
-                'bg_primary': '#ffffff',
-                'bg_secondary': '#f8f9fa',
-                'fg_primary': '#212529',
-                'fg_secondary': '#6c757d',
-                'accent': '#007bff',
-                'success': '#28a745',
-                'warning': '#ffc107',
-                'error': '#dc3545'
-            }
-        
-        return colors.get(element, '#000000')
+        return self._colors.get(element, '#000000')
     
     def get_font_size(self, base_size):
         """Get font size based on screen and input method"""
-        if self.detector.screen_info['is_touch_optimized']:
-            return base_size + 4  # Larger fonts for touch
-        elif self.detector.screen_info['is_small_screen']:
-            return base_size + 2  # Slightly larger for small screens
-        else:
-            return base_size  # Normal size for desktop
+        try:
+            return self._font_sizes[base_size]
+        except KeyError:
+            return base_size + self._font_delta
     
     def setup_styles(self):
         """Setup adaptive styles"""
@@ -328,40 +558,64 @@ class AdaptiveHamsterGUI:
         
         # Choose theme based on environment
         if self.window_mode in ['fullscreen_console', 'touchscreen']:
+            # Dark theme for gaming consoles and small screens
+            self._colors = self.DARK_COLORS
             try:
                 style.theme_use('clam')
             except:
                 pass
         else:
+            # Light theme for desktop
+            self._colors = self.LIGHT_COLORS
             try:
                 style.theme_use('default')
             except:
                 pass
         
-        # Configure styles with adaptive sizing
-        title_font_size = self.get_font_size(24)
-        button_font_size = self.get_font_size(14)
-        text_font_size = self.get_font_size(11)
-        
-        # Button padding based on input method
-        if self.detector.input_methods['touchscreen']:
-            button_padding = (30, 15)  # Larger padding for touch
+        # Resolve font sizes once instead of per widget
+        if self.detector.screen_info['is_touch_optimized']:
+            self._font_delta = 4  # Larger fonts for touch
+        elif self.detector.screen_info['is_small_screen']:
+            self._font_delta = 2  # Slightly larger for small screens
         else:
-            button_padding = (20, 10)  # Normal padding
+            self._font_delta = 0  # Normal size for desktop
+        self._font_sizes = {size: size + self._font_delta
+                            for size in (9, 10, 11, 12, 14, 16, 18, 20, 24)}
         
-        style.configure('Title.TLabel',
-                       font=('Arial', title_font_size, 'bold'),
-                       foreground=self.get_theme_color('fg_primary'),
-                       background=self.get_theme_color('bg_primary'))
-        
-        style.configure('AdaptiveButton.TButton',
-                       font=('Arial', button_font_size),
-                       padding=button_padding)
+        # Configure window based on capabilities
+        self.root.configure(bg=self._colors['bg_primary'])
         
-        style.configure('Status.TLabel',
-                       font=('Arial', text_font_size),
-                       foreground=self.get_theme_color('success'),
-                       background=self.get_theme_color('bg_secondary'))
+        # Individual styles are configured by get_style() on first use
+        self.style = style
+        self._configured_styles = set()
+    
+    def get_style(self, name):
+        """Configure a ttk style the first time a widget uses it"""
+        if name in self._configured_styles:
+            return name
+        
+        if name == 'Title.TLabel':
+            self.style.configure(name,
+                                 font=('Arial', self.get_font_size(24), 'bold'),
+                                 foreground=self._colors['fg_primary'],
+                                 background=self._colors['bg_primary'])
+        elif name == 'AdaptiveButton.TButton':
+            # Button padding based on input method
+            if self.detector.input_methods['touchscreen']:
+                button_padding = (30, 15)  # Larger padding for touch
+            else:
+                button_padding = (20, 10)  # Normal padding
+            self.style.configure(name,
+                                 font=('Arial', self.get_font_size(14)),
+                                 padding=button_padding)
+        elif name == 'Status.TLabel':
+            self.style.configure(name,
+                                 font=('Arial', self.get_font_size(11)),
+                                 foreground=self._colors['success'],
+                                 background=self._colors['bg_secondary'])
+        
+        self._configured_styles.add(name)
+        return name
     
     def setup_input_handlers(self):
         """Setup input handlers based on detected input methods"""
@@ -380,23 +634,29 @@ class AdaptiveHamsterGUI:
     
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        shortcuts = {
-            '<Key-1>': lambda e: self.launch_aprs(),
-            '<Key-2>': lambda e: self.launch_qsstv(),
-            '<Key-3>': lambda e: self.show_settings(),
-            '<Key-4>': lambda e: self.check_dependencies(),
-            '<Key-5>': lambda e: self.install_dependencies(),
-            '<Return>': lambda e: self.launch_aprs(),
-            '<space>': lambda e: self.launch_qsstv(),
-            '<Escape>': lambda e: self.show_settings(),
-            '<F1>': lambda e: self.show_help(),
-            '<F5>': lambda e: self.refresh_status(),
-            '<F11>': lambda e: self.toggle_fullscreen(),
-            '<Control-q>': lambda e: self.root.quit()
+        # One <Key> binding dispatches through this table by keysym
+        self._key_table = {
+            '1': self.launch_aprs,
+            '2': self.launch_qsstv,
+            '3': self.show_settings,
+            '4': self.check_dependencies,
+            '5': self.install_dependencies,
+            'Return': self.launch_aprs,
+            'space': self.launch_qsstv,
+            'Escape': self.show_settings,
+            'F1': self.show_help,
+            'F5': self.refresh_status,
+            'F11': self.toggle_fullscreen
         }
         
-        for key, func in shortcuts.items():
-            self.root.bind(key, func)
+        self.root.bind('<Key>', self.on_key)
+        self.root.bind('<Control-q>', lambda e: self.root.quit())
+    
+    def on_key(self, event):
+        """Dispatch a key press to its shortcut, if any"""
+        action = self._key_table.get(event.keysym)
+        if action:
+            action()
     
     def setup_touch_handlers(self):
         """Setup touch-specific handlers"""
@@ -442,7 +702,7 @@ class AdaptiveHamsterGUI:
         # Main container with adaptive padding
         padding = 30 if self.detector.screen_info['is_touch_optimized'] else 20
         
-        main_frame = tk.Frame(self.root, bg=self.get_theme_color('bg_primary'))
+        main_frame = tk.Frame(self.root, bg=self._colors['bg_primary'])
         main_frame.pack(fill=tk.BOTH, expand=True, padx=padding, pady=padding)
         
         # Create sections based on window mode
@@ -455,18 +715,19 @@ class AdaptiveHamsterGUI:
     
     def create_desktop_layout(self, parent):
         """Create layout optimized for desktop"""
+        colors = self._colors
         # Use three-column layout for desktop
         
         # Left column - Status and info
-        left_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        left_frame = tk.Frame(parent, bg=colors['bg_primary'])
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=(0, 10))
         
         # Middle column - Main buttons
-        middle_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        middle_frame = tk.Frame(parent, bg=colors['bg_primary'])
         middle_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         
         # Right column - System info
-        right_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        right_frame = tk.Frame(parent, bg=colors['bg_primary'])
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=False, padx=(10, 0))
         
         self.create_title_section(middle_frame)
@@ -492,30 +753,33 @@ class AdaptiveHamsterGUI:
         
     def create_title_section(self, parent):
         """Create title section"""
-        title_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        colors = self._colors
+        title_frame = tk.Frame(parent, bg=colors['bg_primary'])
         title_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Adaptive title
-        if self.detector.environment['is_pi']:
+        env = self.detector.environment
+        if env['is_pi']:
             title_text = "🔊 HAMSTER (Raspberry Pi)"
-        elif self.detector.environment['is_console']:
+        elif env['is_console']:
             title_text = "🔊 HAMSTER (Console)"
         else:
             title_text = "🔊 HAMSTER"
         
-        title_label = ttk.Label(title_frame, text=title_text, style='Title.TLabel')
+        title_label = ttk.Label(title_frame, text=title_text, style=self.get_style('Title.TLabel'))
         title_label.pack()
         
         subtitle_label = tk.Label(title_frame,
                                  text="Professional Amateur Radio Suite",
                                  font=('Arial', self.get_font_size(14)),
-                                 fg=self.get_theme_color('fg_secondary'),
-                                 bg=self.get_theme_color('bg_primary'))
+                                 fg=colors['fg_secondary'],
+                                 bg=colors['bg_primary'])
         subtitle_label.pack()
     
     def create_main_buttons_desktop(self, parent):
         """Create main buttons for desktop layout"""
-        button_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        colors = self._colors
+        button_frame = tk.Frame(parent, bg=colors['bg_primary'])
         button_frame.pack(fill=tk.BOTH, expand=True)
         
         # Large main buttons
@@ -525,16 +789,17 @@ class AdaptiveHamsterGUI:
             ("🔧 Settings\nConfiguration", self.show_settings, '#f39c12'),
         ]
         
+        font = ('Arial', self.get_font_size(16), 'bold')
         for i, (text, command, color) in enumerate(buttons):
             btn = tk.Button(button_frame, text=text, command=command,
-                          font=('Arial', self.get_font_size(16), 'bold'),
+                          font=font,
                           bg=color, fg='white',
                           width=20, height=4,
                           relief='raised', bd=3)
             btn.pack(fill=tk.X, pady=5)
         
         # Secondary buttons in grid
-        secondary_frame = tk.Frame(button_frame, bg=self.get_theme_color('bg_primary'))
+        secondary_frame = tk.Frame(button_frame, bg=colors['bg_primary'])
         secondary_frame.pack(fill=tk.X, pady=(20, 0))
         
         secondary_buttons = [
@@ -544,9 +809,10 @@ class AdaptiveHamsterGUI:
             ("❓ Help", self.show_help, '#7f8c8d')
         ]
         
+        font = ('Arial', self.get_font_size(12))
         for i, (text, command, color) in enumerate(secondary_buttons):
             btn = tk.Button(secondary_frame, text=text, command=command,
-                          font=('Arial', self.get_font_size(12)),
+                          font=font,
                           bg=color, fg='white',
                           width=12, height=2)
             btn.grid(row=0, column=i, padx=2, pady=2)
@@ -556,7 +822,7 @@ class AdaptiveHamsterGUI:
     
     def create_main_buttons_touch(self, parent):
         """Create touch-optimized main buttons"""
-        button_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        button_frame = tk.Frame(parent, bg=self._colors['bg_primary'])
         button_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Extra large buttons for touch
@@ -566,9 +832,10 @@ class AdaptiveHamsterGUI:
             ("🔧 Settings", self.show_settings, '#f39c12'),
         ]
         
+        font = ('Arial', self.get_font_size(20), 'bold')
         for text, command, color in buttons:
             btn = tk.Button(button_frame, text=text, command=command,
-                          font=('Arial', self.get_font_size(20), 'bold'),
+                          font=font,
                           bg=color, fg='white',
                           height=3,
                           relief='raised', bd=4)
@@ -580,7 +847,7 @@ class AdaptiveHamsterGUI:
     
     def create_main_buttons_minimal(self, parent):
         """Create minimal buttons"""
-        button_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        button_frame = tk.Frame(parent, bg=self._colors['bg_primary'])
         button_frame.pack(fill=tk.X, pady=(0, 20))
         
         buttons = [
@@ -590,9 +857,10 @@ class AdaptiveHamsterGUI:
             ("Help", self.show_help)
         ]
         
+        font = ('Arial', self.get_font_size(12))
         for i, (text, command) in enumerate(buttons):
             btn = tk.Button(button_frame, text=text, command=command,
-                          font=('Arial', self.get_font_size(12)))
+                          font=font)
             btn.grid(row=0, column=i, padx=2, pady=2, sticky='ew')
             
         for i in range(len(buttons)):
@@ -607,9 +875,10 @@ class AdaptiveHamsterGUI:
     
     def create_status_section(self, parent):
         """Create status section"""
+        colors = self._colors
         status_frame = tk.LabelFrame(parent, text="System Status",
-                                   bg=self.get_theme_color('bg_secondary'),
-                                   fg=self.get_theme_color('fg_primary'),
+                                   bg=colors['bg_secondary'],
+                                   fg=colors['fg_primary'],
                                    font=('Arial', self.get_font_size(12), 'bold'))
         status_frame.pack(fill=tk.X, pady=(0, 20))
         
@@ -622,53 +891,61 @@ class AdaptiveHamsterGUI:
             ('qsstv', 'QSSTV')
         ]
         
+        bg = colors['bg_secondary']
+        label_font = ('Arial', self.get_font_size(10))
+        value_font = ('Arial', self.get_font_size(10), 'bold')
         for i, (key, label) in enumerate(status_items):
-            frame = tk.Frame(status_frame, bg=self.get_theme_color('bg_secondary'))
+            frame = tk.Frame(status_frame, bg=bg)
             frame.pack(fill=tk.X, padx=5, pady=2)
             
             tk.Label(frame, text=f"{label}:", 
-                    bg=self.get_theme_color('bg_secondary'),
-                    fg=self.get_theme_color('fg_primary'),
-                    font=('Arial', self.get_font_size(10))).pack(side=tk.LEFT)
+                    bg=bg,
+                    fg=colors['fg_primary'],
+                    font=label_font).pack(side=tk.LEFT)
             
-            self.status_labels[key] = tk.Label(frame, text="Checking...",
-                                             bg=self.get_theme_color('bg_secondary'),
-                                             fg=self.get_theme_color('warning'),
-                                             font=('Arial', self.get_font_size(10), 'bold'))
-            self.status_labels[key].pack(side=tk.RIGHT)
+            var = tk.StringVar(value="Checking...")
+            value_label = tk.Label(frame, textvariable=var,
+                                 bg=bg,
+                                 fg=colors['warning'],
+                                 font=value_font)
+            value_label.pack(side=tk.RIGHT)
+            self.status_labels[key] = (var, value_label)
     
     def create_status_section_touch(self, parent):
         """Create touch-optimized status section"""
-        status_frame = tk.Frame(parent, bg=self.get_theme_color('bg_secondary'))
+        colors = self._colors
+        status_frame = tk.Frame(parent, bg=colors['bg_secondary'])
         status_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Horizontal status bar for touch screens
         self.status_text = tk.Label(status_frame, text="Checking system status...",
-                                   bg=self.get_theme_color('bg_secondary'),
-                                   fg=self.get_theme_color('fg_primary'),
+                                   bg=colors['bg_secondary'],
+                                   fg=colors['fg_primary'],
                                    font=('Arial', self.get_font_size(12)))
         self.status_text.pack(fill=tk.X, padx=10, pady=5)
     
     def create_system_info_desktop(self, parent):
         """Create system info for desktop"""
+        colors = self._colors
         info_frame = tk.LabelFrame(parent, text="System Info",
-                                 bg=self.get_theme_color('bg_secondary'),
-                                 fg=self.get_theme_color('fg_primary'),
+                                 bg=colors['bg_secondary'],
+                                 fg=colors['fg_primary'],
                                  font=('Arial', self.get_font_size(12), 'bold'))
         info_frame.pack(fill=tk.BOTH, expand=True)
         
         self.info_text_widget = tk.Text(info_frame,
-                                       bg=self.get_theme_color('bg_secondary'),
-                                       fg=self.get_theme_color('fg_primary'),
+                                       bg=colors['bg_secondary'],
+                                       fg=colors['fg_primary'],
                                        font=('Monaco', self.get_font_size(9)),
                                        height=10, wrap=tk.WORD)
         self.info_text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
     def create_environment_info(self, parent):
         """Create environment detection info"""
+        colors = self._colors
         env_frame = tk.LabelFrame(parent, text="Environment",
-                                bg=self.get_theme_color('bg_secondary'),
-                                fg=self.get_theme_color('fg_primary'),
+                                bg=colors['bg_secondary'],
+                                fg=colors['fg_primary'],
                                 font=('Arial', self.get_font_size(12), 'bold'))
         env_frame.pack(fill=tk.X, pady=(20, 0))
         
@@ -683,14 +960,15 @@ class AdaptiveHamsterGUI:
         env_text += f"Mode: {self.window_mode}"
         
         tk.Label(env_frame, text=env_text,
-                bg=self.get_theme_color('bg_secondary'),
-                fg=self.get_theme_color('fg_secondary'),
+                bg=colors['bg_secondary'],
+                fg=colors['fg_secondary'],
                 font=('Arial', self.get_font_size(9)),
                 justify=tk.LEFT).pack(anchor='w', padx=5, pady=5)
     
     def create_control_hints_touch(self, parent):
         """Create control hints for touch"""
-        hints_frame = tk.Frame(parent, bg=self.get_theme_color('bg_primary'))
+        colors = self._colors
+        hints_frame = tk.Frame(parent, bg=colors['bg_primary'])
         hints_frame.pack(fill=tk.X)
         
         if self.detector.input_methods['touchscreen']:
@@ -699,8 +977,8 @@ class AdaptiveHamsterGUI:
             hints_text = "⌨️ Use number keys for quick access • F1 for help • F11 for fullscreen"
             
         tk.Label(hints_frame, text=hints_text,
-                bg=self.get_theme_color('bg_primary'),
-                fg=self.get_theme_color('fg_secondary'),
+                bg=colors['bg_primary'],
+                fg=colors['fg_secondary'],
                 font=('Arial', self.get_font_size(9))).pack()
     
     def show_environment_info(self):
@@ -726,56 +1004,106 @@ class AdaptiveHamsterGUI:
         if hasattr(self, 'status_text'):
             original_text = self.status_text.cget('text')
             self.status_text.config(text=info_text)
-            self.root.after(3000, lambda: self.status_text.config(text=original_text))
+            self.root.after(3000, lambda: self.restore_status_text(original_text))
+    
+    def restore_status_text(self, original_text):
+        """Put the status line back after a temporary message"""
+        # The line was overwritten behind update_status_display's back, so the
+        # last snapshot no longer matches what is shown; repaint from it instead
+        last_status = self._last_status
+        self._last_status = None
+        if last_status is None:
+            self.status_text.config(text=original_text)
+        else:
+            self.update_status_display(last_status)
     
     def check_system_status(self):
         """Check system status with adaptive display"""
-        def update_status():
-            status_info = {}
+        self._last_status_check = time.monotonic()
+        self._status_queue.put(None)
+    
+    def status_worker(self):
+        """Long-lived worker thread that runs queued status polls"""
+        while True:
+            self._status_queue.get()
+            # Polls requested while we were busy are served by this one
+            while not self._status_queue.empty():
+                self._status_queue.get_nowait()
             
             try:
-                # Check services
-                for service in ['ssh', 'bluetooth']:
-                    result = subprocess.run(['systemctl', 'is-active', service],
-                                          capture_output=True, text=True)
-                    status_info[service] = result.stdout.strip() == 'active'
-                
-                # Check network
-                try:
-                    result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
-                    ip = result.stdout.strip().split()[0] if result.stdout.strip() else None
-                    status_info['network'] = bool(ip)
-                    status_info['ip'] = ip
-                except:
-                    status_info['network'] = False
-                    status_info['ip'] = None
-                
-                # Check applications
-                for app in ['direwolf', 'qsstv']:
-                    result = subprocess.run(['which', app], capture_output=True)
-                    status_info[app] = result.returncode == 0
-                
-                # Update UI
-                self.update_status_display(status_info)
-                
+                status_info = self.probe_system_status()
+                # Update UI from the Tk thread
+                self.root.after(0, self.update_status_display, status_info)
             except Exception as e:
                 print(f"Error checking status: {e}")
-        
-        threading.Thread(target=update_status, daemon=True).start()
+    
+    def probe_system_status(self):
+        """Collect service, network and application status"""
+        status_info = {}
+        services = ['ssh', 'bluetooth']
+        apps = ['direwolf', 'qsstv']
+        
+        # Check services (systemctl prints one state per unit, in order)
+        ip = get_primary_ip()
+        if ip:
+            result = self.runner.run(['systemctl', 'is-active'] + services,
+                                     ttl=SERVICE_STATUS_TTL)
+            states = result.stdout.split()
+        else:
+            # No routed address from the socket lookup: let hostname -I report
+            # any address it can find, in the same spawn as the service check
+            result = self.runner.run(['/bin/sh', '-c',
+                                      'systemctl is-active "$@"; echo --; hostname -I',
+                                      'sh'] + services,
+                                     ttl=PRIMARY_IP_TTL)
+            head, _, tail = result.stdout.partition('--\n')
+            states = head.split()
+            addresses = tail.split()
+            ip = addresses[0] if addresses else None
+        
+        for i, service in enumerate(services):
+            status_info[service] = i < len(states) and states[i] == 'active'
+        
+        # Check network
+        status_info['network'] = bool(ip)
+        status_info['ip'] = ip
+        
+        # Check applications
+        for app in apps:
+            status_info[app] = find_executable(app) is not None
+        
+        return status_info
     
     def update_status_display(self, status_info):
         """Update status display based on layout"""
+        # Nothing changed since the last poll: skip the Tk relayout entirely
+        if status_info == self._last_status:
+            return
+        
+        previous = self._last_status or {}
+        self._last_status = dict(status_info)
+        changed = {key for key in status_info if status_info[key] != previous.get(key)}
+        if 'ip' in changed:
+            changed.add('network')
+        
         if hasattr(self, 'status_labels'):
             # Desktop/minimal layout with individual labels
             for key, value in status_info.items():
-                if key in self.status_labels:
+                if key in self.status_labels and key in changed:
                     if key == 'network' and status_info.get('ip'):
                         text = f"Connected ({status_info['ip'][:15]}...)"
                     else:
                         text = "Active" if value else "Inactive"
                     
-                    color = self.get_theme_color('success') if value else self.get_theme_color('error')
-                    self.status_labels[key].config(text=text, fg=color)
+                    var, value_label = self.status_labels[key]
+                    var.set(text)
+                    
+                    # Only recolor when the label flips between up and down
+                    state = bool(value)
+                    if self._status_states.get(key) != state:
+                        self._status_states[key] = state
+                        color = self._colors['success'] if state else self._colors['error']
+                        value_label.config(fg=color)
         
         if hasattr(self, 'status_text'):
             # Touch layout with single status line
@@ -792,17 +1120,7 @@ class AdaptiveHamsterGUI:
     def update_system_info_text(self):
         """Update system info text widget"""
         try:
-            info = f"Environment: {self.detector.environment['type']}\n"
-            info += f"Screen: {self.detector.screen_info['width']}x{self.detector.screen_info['height']}\n"
-            info += f"Touch: {'Yes' if self.detector.input_methods['touchscreen'] else 'No'}\n"
-            info += f"Gamepad: {'Yes' if self.detector.input_methods['gamepad'] else 'No'}\n"
-            
-            # Add system info
-            try:
-                uname = subprocess.run(['uname', '-r'], capture_output=True, text=True).stdout.strip()
-                info += f"Kernel: {uname}\n"
-            except:
-                pass
+            info = f"{self._sysinfo_prefix}Kernel: {self._uname.release}\n"
             
             self.info_text_widget.delete(1.0, tk.END)
             self.info_text_widget.insert(1.0, info)
@@ -810,31 +1128,59 @@ class AdaptiveHamsterGUI:
         except Exception as e:
             print(f"Error updating system info: {e}")
     
+    def push_modal(self, window):
+        """Make window the topmost modal and give it the input grab"""
+        if window in self._modal_stack:
+            self._modal_stack.remove(window)
+        self._modal_stack.append(window)
+        window.grab_set()
+    
+    def pop_modal(self, window):
+        """Release window's grab and hand it back to the next modal down"""
+        window.grab_release()
+        if window in self._modal_stack:
+            self._modal_stack.remove(window)
+        if self._modal_stack:
+            self._modal_stack[-1].grab_set()
+    
     def show_quick_menu(self):
         """Show quick access menu"""
-        QuickMenuWindow(self.root, self)
+        if self._quick_menu is None:
+            self._quick_menu = QuickMenuWindow(self.root, self)
+        else:
+            self._quick_menu.show()
+    
+    def spawn_detached(self, argv):
+        """Start a program in its own session without inheriting our stdio"""
+        # Our descriptors are non-inheritable already, so skip the close_fds sweep
+        subprocess.Popen(argv, start_new_session=True, close_fds=False,
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL)
     
     def launch_aprs(self):
         """Launch APRS Chatty X"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', 'launch_aprs_chatty_x.sh')
+        script_path = os.path.join(SCRIPTS_DIR, 'launch_aprs_chatty_x.sh')
         try:
-            subprocess.Popen(['bash', script_path], start_new_session=True)
+            self.spawn_detached(['/bin/bash', script_path])
             self.show_message("APRS Chatty X", "Launching APRS Chatty X...")
         except Exception as e:
             self.show_error("Error", f"Failed to launch APRS Chatty X: {e}")
     
     def launch_qsstv(self):
         """Launch QSSTV"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', 'launch_qsstv.sh')
+        script_path = os.path.join(SCRIPTS_DIR, 'launch_qsstv.sh')
         try:
-            subprocess.Popen(['bash', script_path], start_new_session=True)
+            self.spawn_detached(['/bin/bash', script_path])
             self.show_message("QSSTV", "Launching QSSTV...")
         except Exception as e:
             self.show_error("Error", f"Failed to launch QSSTV: {e}")
     
     def show_settings(self):
         """Show adaptive settings window"""
-        AdaptiveSettingsWindow(self.root, self)
+        if self._settings_window is None:
+            self._settings_window = AdaptiveSettingsWindow(self.root, self)
+        else:
+            self._settings_window.show()
     
     def check_dependencies(self):
         """Check dependencies"""
@@ -849,16 +1195,18 @@ class AdaptiveHamsterGUI:
     
     def show_system_info(self):
         """Show system information window"""
-        AdaptiveSystemInfoWindow(self.root, self)
+        if self._system_info_window is None:
+            self._system_info_window = AdaptiveSystemInfoWindow(self.root, self)
+        else:
+            self._system_info_window.show()
     
     def show_help(self):
         """Show adaptive help"""
-        help_text = self.get_adaptive_help_text()
-        self.show_message("Help - Hamster Ham Radio Manager", help_text)
+        self.show_message("Help - Hamster Ham Radio Manager", self._help_text)
     
     def get_adaptive_help_text(self):
         """Get help text based on environment"""
-        base_help = """🔊 HAMSTER - Ham Radio Manager
+        parts = ["""🔊 HAMSTER - Ham Radio Manager
 
 APPLICATIONS:
 📻 APRS Chatty X - Packet radio messaging
@@ -870,42 +1218,68 @@ F1 - Help
 F5 - Refresh
 F11 - Toggle fullscreen
 Ctrl+Q - Quit
-"""
+"""]
         
         if self.detector.input_methods['touchscreen']:
-            base_help += "\nTOUCH CONTROLS:\n👆 Tap buttons to select\n✌️ Double-tap for quick menu\n"
+            parts.append("\nTOUCH CONTROLS:\n👆 Tap buttons to select\n✌️ Double-tap for quick menu\n")
         
         if self.detector.input_methods['gamepad']:
-            base_help += "\nGAMEPAD CONTROLS:\n🎮 D-pad for navigation\n🅰 A button to select\n"
+            parts.append("\nGAMEPAD CONTROLS:\n🎮 D-pad for navigation\n🅰 A button to select\n")
         
-        return base_help
+        return "".join(parts)
     
     def refresh_status(self):
         """Refresh system status"""
-        self.check_system_status()
+        # Applications may have been installed and services started since the
+        # last lookup, so don't answer from any cache
+        find_executable.cache_clear()
+        self.runner.invalidate()
+        
+        # An explicit refresh always repaints, even if nothing changed
+        self._last_status = None
+        
+        # Coalesce bursts of refreshes into one poll every 500 ms
+        elapsed = time.monotonic() - self._last_status_check
+        if elapsed >= 0.5:
+            self.check_system_status()
+        elif not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(int((0.5 - elapsed) * 1000), self.run_pending_refresh)
+        
         self.show_message("Refresh", "System status refreshed!")
     
+    def run_pending_refresh(self):
+        """Run a status poll that was deferred by refresh_status"""
+        self._refresh_pending = False
+        self.check_system_status()
+    
     def show_message(self, title, message):
         """Show message with adaptive styling"""
+        from tkinter import messagebox
         messagebox.showinfo(title, message)
     
     def show_error(self, title, message):
         """Show error with adaptive styling"""
+        from tkinter import messagebox
         messagebox.showerror(title, message)
     
     def show_confirm(self, title, message):
         """Show confirmation dialog"""
+        from tkinter import messagebox
         return messagebox.askyesno(title, message)
     
     def run_script_in_terminal(self, script_name, title):
         """Run script in terminal"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', script_name)
+        script_path = os.path.join(SCRIPTS_DIR, script_name)
         try:
-            terminals = ['x-terminal-emulator', 'gnome-terminal', 'xterm', 'konsole']
-            for terminal in terminals:
-                if subprocess.run(['which', terminal], capture_output=True).returncode == 0:
-                    subprocess.Popen([terminal, '-e', f'bash {script_path}; read -p "Press Enter to close..."'])
-                    break
+            if self._terminal is None:
+                terminals = ('x-terminal-emulator', 'gnome-terminal', 'xterm', 'konsole')
+                # Plain shutil.which: a hit is kept in self._terminal, and a miss
+                # must not be cached so an installed terminal is found next time
+                self._terminal = next(filter(None, map(shutil.which, terminals)), None)
+            
+            if self._terminal:
+                self.spawn_detached([self._terminal, '-e', f'bash {script_path}; read -p "Press Enter to close..."'])
             else:
                 self.show_error("Error", "No terminal emulator found")
         except Exception as e:
@@ -922,12 +1296,24 @@ class QuickMenuWindow:
     def __init__(self, parent, main_app):
         self.main_app = main_app
         self.window = tk.Toplevel(parent)
+        self.window.transient(parent)
         self.window.title("Quick Menu")
         self.window.geometry("300x200")
         self.window.configure(bg=main_app.get_theme_color('bg_primary'))
-        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.main_app.push_modal(self.window)
         
         self.create_quick_menu()
+    
+    def show(self):
+        """Bring the hidden menu back"""
+        self.window.deiconify()
+        self.main_app.push_modal(self.window)
+    
+    def close(self):
+        """Hide the menu so the next open can reuse it"""
+        self.main_app.pop_modal(self.window)
+        self.window.withdraw()
         
     def create_quick_menu(self):
         """Create quick access menu"""
@@ -935,12 +1321,13 @@ class QuickMenuWindow:
             ("📻 APRS", self.main_app.launch_aprs),
             ("📺 QSSTV", self.main_app.launch_qsstv),
             ("🔧 Settings", self.main_app.show_settings),
-            ("❌ Close", self.window.destroy)
+            ("❌ Close", self.close)
         ]
         
+        font = ('Arial', self.main_app.get_font_size(14))
         for text, command in buttons:
             btn = tk.Button(self.window, text=text, command=command,
-                          font=('Arial', self.main_app.get_font_size(14)),
+                          font=font,
                           height=2)
             btn.pack(fill=tk.X, padx=20, pady=5)
 
@@ -951,8 +1338,25 @@ class AdaptiveSettingsWindow:
     def __init__(self, parent, main_app):
         self.main_app = main_app
         self.window = tk.Toplevel(parent)
+        self.window.transient(parent)
         self.window.title("Hamster Settings")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
         self.setup_settings_window()
+    
+    def show(self):
+        """Bring the hidden window back with the saved station values"""
+        station = self.main_app.config['station']
+        for key, entry in self.station_entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, station.get(key, ''))
+        
+        self.window.deiconify()
+        self.main_app.push_modal(self.window)
+    
+    def close(self):
+        """Hide the window so the next open can reuse it"""
+        self.main_app.pop_modal(self.window)
+        self.window.withdraw()
         
     def setup_settings_window(self):
         """Setup settings window based on environment"""
@@ -960,42 +1364,58 @@ class AdaptiveSettingsWindow:
             self.window.geometry("700x500")
         else:
             # Full screen for touch/console
-            self.window.geometry(f"{self.main_app.detector.screen_info['width']}x{self.main_app.detector.screen_info['height']}")
+            screen = self.main_app.detector.screen_info
+            self.window.geometry(f"{screen['width']}x{screen['height']}")
         
         self.window.configure(bg=self.main_app.get_theme_color('bg_primary'))
-        self.window.grab_set()
+        self.main_app.push_modal(self.window)
         
         self.create_settings_content()
     
     def create_settings_content(self):
         """Create settings content"""
+        app = self.main_app
+        
         # Title
         title = tk.Label(self.window, text="System Settings",
-                        font=('Arial', self.main_app.get_font_size(18), 'bold'),
-                        bg=self.main_app.get_theme_color('bg_primary'),
-                        fg=self.main_app.get_theme_color('fg_primary'))
+                        font=('Arial', app.get_font_size(18), 'bold'),
+                        bg=app.get_theme_color('bg_primary'),
+                        fg=app.get_theme_color('fg_primary'))
         title.pack(pady=20)
         
         # Create notebook for settings tabs
         notebook = ttk.Notebook(self.window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        # Add settings tabs
-        self.create_network_tab(notebook)
-        self.create_station_tab(notebook)
-        self.create_system_tab(notebook)
+        # Add settings tabs; each one is only filled the first time it is selected
+        self.station_entries = {}
+        self._tab_builders = {}
+        bg_secondary = app.get_theme_color('bg_secondary')
+        for text, builder in (("Network", self.create_network_tab),
+                              ("Station", self.create_station_tab),
+                              ("System", self.create_system_tab)):
+            frame = tk.Frame(notebook, bg=bg_secondary)
+            notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = builder
+        
+        self.on_tab_changed(notebook)
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.on_tab_changed(e.widget))
         
         # Close button
         tk.Button(self.window, text="Close",
-                 command=self.window.destroy,
-                 font=('Arial', self.main_app.get_font_size(14)),
+                 command=self.close,
+                 font=('Arial', app.get_font_size(14)),
                  height=2).pack(pady=20)
     
-    def create_network_tab(self, notebook):
+    def on_tab_changed(self, notebook):
+        """Fill the selected tab if it has not been built yet"""
+        tab = notebook.select()
+        builder = self._tab_builders.pop(tab, None)
+        if builder:
+            builder(notebook.nametowidget(tab))
+    
+    def create_network_tab(self, frame):
         """Create network settings tab"""
-        frame = tk.Frame(notebook, bg=self.main_app.get_theme_color('bg_secondary'))
-        notebook.add(frame, text="Network")
-        
         # Network controls
         controls = [
             ("Enable SSH", self.enable_ssh),
@@ -1004,16 +1424,19 @@ class AdaptiveSettingsWindow:
             ("Network Info", self.show_network_info)
         ]
         
+        font = ('Arial', self.main_app.get_font_size(12))
         for text, command in controls:
             btn = tk.Button(frame, text=text, command=command,
-                          font=('Arial', self.main_app.get_font_size(12)),
+                          font=font,
                           height=2)
             btn.pack(fill=tk.X, padx=20, pady=10)
     
-    def create_station_tab(self, notebook):
+    def create_station_tab(self, frame):
         """Create ham station settings tab"""
-        frame = tk.Frame(notebook, bg=self.main_app.get_theme_color('bg_secondary'))
-        notebook.add(frame, text="Station")
+        app = self.main_app
+        bg_secondary = app.get_theme_color('bg_secondary')
+        fg_primary = app.get_theme_color('fg_primary')
+        font = ('Arial', app.get_font_size(12))
         
         # Station settings form
         settings = [
@@ -1023,46 +1446,46 @@ class AdaptiveSettingsWindow:
             ("Operator:", "operator")
         ]
         
-        self.station_entries = {}
-        
+        station = app.config['station']
         for label_text, key in settings:
-            row_frame = tk.Frame(frame, bg=self.main_app.get_theme_color('bg_secondary'))
+            row_frame = tk.Frame(frame, bg=bg_secondary)
             row_frame.pack(fill=tk.X, padx=20, pady=10)
             
             tk.Label(row_frame, text=label_text,
-                    bg=self.main_app.get_theme_color('bg_secondary'),
-                    fg=self.main_app.get_theme_color('fg_primary'),
-                    font=('Arial', self.main_app.get_font_size(12))).pack(side=tk.LEFT)
+                    bg=bg_secondary,
+                    fg=fg_primary,
+                    font=font).pack(side=tk.LEFT)
             
-            entry = tk.Entry(row_frame, font=('Arial', self.main_app.get_font_size(12)))
+            entry = tk.Entry(row_frame, font=font)
             entry.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
-            entry.insert(0, self.main_app.config['station'].get(key, ''))
+            entry.insert(0, station.get(key, ''))
             self.station_entries[key] = entry
         
         # Save button
         tk.Button(frame, text="Save Station Settings",
                  command=self.save_station_settings,
-                 font=('Arial', self.main_app.get_font_size(12)),
-                 bg=self.main_app.get_theme_color('success'),
+                 font=font,
+                 bg=app.get_theme_color('success'),
                  fg='white',
                  height=2).pack(fill=tk.X, padx=20, pady=20)
     
-    def create_system_tab(self, notebook):
+    def create_system_tab(self, frame):
         """Create system settings tab"""
-        frame = tk.Frame(notebook, bg=self.main_app.get_theme_color('bg_secondary'))
-        notebook.add(frame, text="System")
+        app = self.main_app
+        detector = app.detector
+        bg_secondary = app.get_theme_color('bg_secondary')
         
         # System info display
-        info_text = f"""Environment: {self.main_app.detector.environment['type']}
-Screen: {self.main_app.detector.screen_info['width']}x{self.main_app.detector.screen_info['height']}
-Touch: {'Available' if self.main_app.detector.input_methods['touchscreen'] else 'Not available'}
-Gamepad: {'Available' if self.main_app.detector.input_methods['gamepad'] else 'Not available'}
-Window Mode: {self.main_app.window_mode}"""
+        info_text = f"""Environment: {detector.environment['type']}
+Screen: {detector.screen_info['width']}x{detector.screen_info['height']}
+Touch: {'Available' if detector.input_methods['touchscreen'] else 'Not available'}
+Gamepad: {'Available' if detector.input_methods['gamepad'] else 'Not available'}
+Window Mode: {app.window_mode}"""
         
         tk.Label(frame, text=info_text,
-                bg=self.main_app.get_theme_color('bg_secondary'),
-                fg=self.main_app.get_theme_color('fg_primary'),
-                font=('Arial', self.main_app.get_font_size(11)),
+                bg=bg_secondary,
+                fg=app.get_theme_color('fg_primary'),
+                font=('Arial', app.get_font_size(11)),
                 justify=tk.LEFT).pack(anchor='w', padx=20, pady=20)
     
     def enable_ssh(self):
@@ -1070,6 +1493,10 @@ Window Mode: {self.main_app.window_mode}"""
         try:
             subprocess.run(['sudo', 'systemctl', 'enable', 'ssh'], check=True)
             subprocess.run(['sudo', 'systemctl', 'start', 'ssh'], check=True)
+            
+            # Service states changed; drop cached probes and show the new ones
+            self.main_app.runner.invalidate()
+            self.main_app.check_system_status()
             self.main_app.show_message("SSH", "SSH enabled successfully!")
         except Exception as e:
             self.main_app.show_error("Error", f"Failed to enable SSH: {e}")
@@ -1079,6 +1506,10 @@ Window Mode: {self.main_app.window_mode}"""
         try:
             subprocess.run(['sudo', 'systemctl', 'enable', 'NetworkManager'], check=True)
             subprocess.run(['sudo', 'systemctl', 'start', 'NetworkManager'], check=True)
+            
+            # Service states changed; drop cached probes and show the new ones
+            self.main_app.runner.invalidate()
+            self.main_app.check_system_status()
             self.main_app.show_message("WiFi", "WiFi enabled successfully!")
         except Exception as e:
             self.main_app.show_error("Error", f"Failed to enable WiFi: {e}")
@@ -1090,8 +1521,14 @@ Window Mode: {self.main_app.window_mode}"""
     def show_network_info(self):
         """Show network information"""
         try:
-            result = subprocess.run(['ip', 'addr'], capture_output=True, text=True)
-            self.main_app.show_message("Network Info", result.stdout[:500] + "...")
+            # Only the first 500 bytes are shown, so don't buffer the rest
+            proc = subprocess.Popen(['ip', 'addr'], stdout=subprocess.PIPE,
+                                    stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            data = proc.stdout.read(500)
+            proc.stdout.close()
+            proc.terminate()
+            proc.wait()
+            self.main_app.show_message("Network Info", data.decode('utf-8', 'replace') + "...")
         except:
             self.main_app.show_error("Error", "Failed to get network info")
     
@@ -1110,6 +1547,7 @@ class AdaptiveSystemInfoWindow:
     def __init__(self, parent, main_app):
         self.main_app = main_app
         self.window = tk.Toplevel(parent)
+        self.window.transient(parent)
         self.window.title("System Information")
         
         if main_app.window_mode == 'desktop':
@@ -1118,20 +1556,34 @@ class AdaptiveSystemInfoWindow:
             self.window.geometry("400x300")
         
         self.window.configure(bg=main_app.get_theme_color('bg_primary'))
-        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.main_app.push_modal(self.window)
         
         self.create_info_display()
     
+    def show(self):
+        """Bring the hidden window back with fresh information"""
+        self.load_system_info()
+        self.window.deiconify()
+        self.main_app.push_modal(self.window)
+    
+    def close(self):
+        """Hide the window so the next open can reuse it"""
+        self.main_app.pop_modal(self.window)
+        self.window.withdraw()
+    
     def create_info_display(self):
         """Create system info display"""
+        app = self.main_app
+        
         # Scrollable text area
-        text_frame = tk.Frame(self.window, bg=self.main_app.get_theme_color('bg_primary'))
+        text_frame = tk.Frame(self.window, bg=app.get_theme_color('bg_primary'))
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         self.info_text = tk.Text(text_frame,
-                               bg=self.main_app.get_theme_color('bg_secondary'),
-                               fg=self.main_app.get_theme_color('fg_primary'),
-                               font=('Monaco', self.main_app.get_font_size(10)),
+                               bg=app.get_theme_color('bg_secondary'),
+                               fg=app.get_theme_color('fg_primary'),
+                               font=('Monaco', app.get_font_size(10)),
                                wrap=tk.WORD)
         
         scrollbar = tk.Scrollbar(text_frame, command=self.info_text.yview)
@@ -1144,67 +1596,67 @@ class AdaptiveSystemInfoWindow:
         
         # Close button
         tk.Button(self.window, text="Close",
-                 command=self.window.destroy,
-                 font=('Arial', self.main_app.get_font_size(12)),
+                 command=self.close,
+                 font=('Arial', app.get_font_size(12)),
                  height=2).pack(pady=10)
     
     def load_system_info(self):
         """Load comprehensive system information"""
-        info = "HAMSTER SYSTEM INFORMATION\n"
-        info += "=" * 50 + "\n\n"
+        parts = ["HAMSTER SYSTEM INFORMATION\n", "=" * 50 + "\n\n"]
         
         # Environment detection
         env = self.main_app.detector.environment
-        info += f"DETECTED ENVIRONMENT:\n"
-        info += f"Type: {env['type']}\n"
-        info += f"Raspberry Pi: {'Yes' if env['is_pi'] else 'No'}\n"
-        info += f"Desktop Environment: {env['desktop_environment'] or 'None'}\n"
-        info += f"Gaming Console: {'Yes' if env['is_console'] else 'No'}\n"
-        info += f"Systemd: {'Yes' if env['has_systemd'] else 'No'}\n\n"
+        parts.append("DETECTED ENVIRONMENT:\n")
+        parts.append(f"Type: {env['type']}\n")
+        parts.append(f"Raspberry Pi: {'Yes' if env['is_pi'] else 'No'}\n")
+        parts.append(f"Desktop Environment: {env['desktop_environment'] or 'None'}\n")
+        parts.append(f"Gaming Console: {'Yes' if env['is_console'] else 'No'}\n")
+        parts.append(f"Systemd: {'Yes' if env['has_systemd'] else 'No'}\n\n")
         
         # Input methods
         inputs = self.main_app.detector.input_methods
-        info += f"INPUT METHODS:\n"
-        info += f"Touchscreen: {'Yes' if inputs['touchscreen'] else 'No'}\n"
-        info += f"Mouse: {'Yes' if inputs['mouse'] else 'No'}\n"
-        info += f"Gamepad: {'Yes' if inputs['gamepad'] else 'No'}\n"
+        parts.append("INPUT METHODS:\n")
+        parts.append(f"Touchscreen: {'Yes' if inputs['touchscreen'] else 'No'}\n")
+        parts.append(f"Mouse: {'Yes' if inputs['mouse'] else 'No'}\n")
+        parts.append(f"Gamepad: {'Yes' if inputs['gamepad'] else 'No'}\n")
         if inputs['joystick_devices']:
-            info += f"Joystick devices: {', '.join(inputs['joystick_devices'])}\n"
-        info += "\n"
+            parts.append(f"Joystick devices: {', '.join(inputs['joystick_devices'])}\n")
+        parts.append("\n")
         
         # Screen info
         screen = self.main_app.detector.screen_info
-        info += f"DISPLAY:\n"
-        info += f"Resolution: {screen['width']}x{screen['height']}\n"
-        info += f"Small screen: {'Yes' if screen['is_small_screen'] else 'No'}\n"
-        info += f"Touch optimized: {'Yes' if screen['is_touch_optimized'] else 'No'}\n"
-        info += f"Window mode: {self.main_app.window_mode}\n\n"
+        parts.append("DISPLAY:\n")
+        parts.append(f"Resolution: {screen['width']}x{screen['height']}\n")
+        parts.append(f"Small screen: {'Yes' if screen['is_small_screen'] else 'No'}\n")
+        parts.append(f"Touch optimized: {'Yes' if screen['is_touch_optimized'] else 'No'}\n")
+        parts.append(f"Window mode: {self.main_app.window_mode}\n\n")
         
         try:
             # System info
-            info += f"SYSTEM:\n"
-            info += f"Kernel: {subprocess.run(['uname', '-r'], capture_output=True, text=True).stdout.strip()}\n"
-            info += f"Architecture: {subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()}\n"
-            info += f"Python: {sys.version.split()[0]}\n"
+            parts.append("SYSTEM:\n")
+            uname = self.main_app._uname
+            parts.append(f"Kernel: {uname.release}\n")
+            parts.append(f"Architecture: {uname.machine}\n")
+            parts.append(f"Python: {sys.version.split()[0]}\n")
             
             # Hardware info
             try:
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if 'MemTotal:' in line:
-                            mem_kb = int(line.split()[1])
-                            info += f"Memory: {round(mem_kb / 1024 / 1024, 1)} GB\n"
-                            break
+                # MemTotal is always the first line of /proc/meminfo
+                head = read_proc_file('/proc/meminfo', 64)
+                mem_kb = int(head.split(b':', 1)[1].split()[0])
+                parts.append(f"Memory: {round(mem_kb / 1024 / 1024, 1)} GB\n")
             except:
-                info += "Memory: Unknown\n"
+                parts.append("Memory: Unknown\n")
             
             # More detailed info...
-            info += f"\n{subprocess.run(['df', '-h'], capture_output=True, text=True).stdout}"
+            parts.append(f"\n{self.main_app.runner.run(['df', '-h'], ttl=SYSTEM_INFO_TTL).stdout}")
             
         except Exception as e:
-            info += f"Error loading system info: {e}\n"
+            parts.append(f"Error loading system info: {e}\n")
         
-        self.info_text.insert(tk.END, info)
+        self.info_text.config(state=tk.NORMAL)
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.insert(tk.END, "".join(parts))
         self.info_text.config(state=tk.DISABLED)
 
 
@@ -1218,7 +1670,6 @@ def main():
         sys.exit(0)
     except Exception as e:
         print(f"Error starting Hamster Adaptive GUI: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -6,31 +6,165 @@ Graphical interface for amateur radio applications on gaming consoles
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 import subprocess
 import os
 import sys
-import threading
+import shutil
+import codecs
+import functools
+import math
+import socket
 import time
 
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
+
+# Service probes in one shell run; prints key=value lines parsed by check_system_status
+STATUS_SCRIPT = """
+printf 'ssh=%s\\n' "$(systemctl is-active ssh 2>/dev/null)"
+printf 'bluetooth=%s\\n' "$(systemctl is-active bluetooth 2>/dev/null)"
+"""
+
+# Appended to STATUS_SCRIPT when the socket lookup finds no route (e.g. a LAN
+# or hotspot without a gateway); hostname -I still lists the local addresses
+IP_FALLBACK_SCRIPT = """
+printf 'ip=%s\\n' "$(hostname -I 2>/dev/null)"
+"""
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts')
+
+# Terminal emulators tried, in order, for running helper scripts
+TERMINALS = ('x-terminal-emulator', 'gnome-terminal', 'xterm', 'konsole')
+
+TEST_SOUND = '/usr/share/sounds/alsa/Front_Left.wav'
+
+# Theme colors shared by every window
+BG_PRIMARY = '#2c3e50'
+BG_SECONDARY = '#34495e'
+FG_PRIMARY = '#ecf0f1'
+
+# Fonts are created once as named Tk fonts and shared by every widget
+FONT_SPECS = {
+    'small': ('Arial', 9),
+    'body': ('Arial', 10),
+    'body_bold': ('Arial', 10, 'bold'),
+    'info': ('Arial', 11),
+    'button': ('Arial', 12),
+    'heading': ('Arial', 12, 'bold'),
+    'subtitle': ('Arial', 14),
+    'section': ('Arial', 14, 'bold'),
+    'primary': ('Arial', 16, 'bold'),
+    'window_title': ('Arial', 18, 'bold'),
+    'title': ('Arial', 24, 'bold'),
+    'mono': ('Monaco', 10),
+}
+
+# Status results younger than this are reused instead of probing again (seconds)
+STATUS_CACHE_TTL = 2.0
+
+
+@functools.lru_cache(maxsize=None)
+def get_uname():
+    """os.uname() never changes during a session, so look it up once"""
+    return os.uname()
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name):
+    """Locate an executable on PATH, remembering the answer"""
+    return shutil.which(name)
+
+
+def create_fonts(root):
+    """Build the shared named fonts from FONT_SPECS"""
+    fonts = {}
+    for name, (family, size, *style) in FONT_SPECS.items():
+        fonts[name] = tkfont.Font(root, family=family, size=size,
+                                  weight=style[0] if style else 'normal')
+    return fonts
+
+
+def format_size(num_bytes):
+    """Format a byte count the way df -h does (e.g. 81G, 3.5G)"""
+    # df rounds up, and picks the precision from the rounded value
+    size = float(num_bytes)
+    for unit in 'BKMGT':
+        if unit == 'T' or math.ceil(size) < 1024:
+            break
+        size /= 1024
+    if unit == 'B':
+        return f"{math.ceil(size)}B"
+    tenths = math.ceil(size * 10) / 10
+    if tenths < 10:
+        return f"{tenths:.1f}{unit}"
+    return f"{math.ceil(size)}{unit}"
+
+
+def get_primary_ip():
+    """Return the IPv4 address of the interface holding the default route"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Connecting a UDP socket sends nothing; it only picks a route
+        sock.connect(('10.255.255.255', 1))
+        return sock.getsockname()[0]
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+
+def gather_system_info(path='.'):
+    """Collect kernel, architecture, primary IP and free disk space in-process"""
+    uname = get_uname()
+    info = {'kernel': uname.release, 'arch': uname.machine, 'ip': get_primary_ip()}
+    try:
+        info['disk'] = format_size(shutil.disk_usage(path).free)
+    except OSError:
+        info['disk'] = None
+    return info
+
+
 class HamsterGUI:
+    # Button color styles: (normal, active/pressed) background
+    BUTTON_COLORS = {
+        'Red': ('#e74c3c', '#c0392b'),
+        'Blue': ('#3498db', '#2980b9'),
+        'Orange': ('#f39c12', '#d68910'),
+        'Purple': ('#9b59b6', '#8e44ad'),
+        'Green': ('#27ae60', '#229954'),
+        'Slate': (BG_SECONDARY, BG_PRIMARY),
+        'Gray': ('#7f8c8d', '#5d6d7e')
+    }
+    
     def __init__(self):
         self.root = tk.Tk()
+        self.fonts = create_fonts(self.root)
+        self._status_cache = {}
+        self._status_cache_ts = 0.0
+        self._status_probe = None
         self.setup_window()
         self.setup_styles()
         self.create_widgets()
-        self.check_system_status()
+        
+        # Probe once the window has painted, not during startup
+        self.root.after_idle(self.check_system_status)
         
     def setup_window(self):
         """Configure main window for gaming console display"""
         self.root.title("Hamster - Ham Radio Manager")
         self.root.geometry("800x480")  # Common gaming console resolution
-        self.root.configure(bg='#2c3e50')
+        self.root.configure(bg=BG_PRIMARY)
         
         # Make it fullscreen-friendly
         self.root.attributes('-zoomed', True)  # Linux fullscreen
         
-        # Center window if not fullscreen
-        self.center_window()
+        # Center window if not fullscreen; a zoomed window has nothing to center,
+        # so skip the forced layout pass and screen size queries
+        if not int(self.root.attributes('-zoomed')):
+            self.center_window()
         
         # Bind controller/keyboard shortcuts
         self.setup_keybindings()
@@ -49,29 +183,38 @@ class HamsterGUI:
         
         # Configure colors for gaming console theme
         style.configure('Title.TLabel', 
-                       font=('Arial', 24, 'bold'),
-                       foreground='#ecf0f1',
-                       background='#2c3e50')
+                       font=self.fonts['title'],
+                       foreground=FG_PRIMARY,
+                       background=BG_PRIMARY)
         
         style.configure('Button.TButton',
-                       font=('Arial', 14),
+                       font=self.fonts['subtitle'],
                        padding=(20, 10))
         
         style.configure('Status.TLabel',
-                       font=('Arial', 12),
+                       font=self.fonts['button'],
                        foreground='#27ae60',
-                       background='#34495e')
+                       background=BG_SECONDARY)
                        
         style.configure('Info.TLabel',
-                       font=('Arial', 11),
-                       foreground='#ecf0f1',
-                       background='#34495e')
+                       font=self.fonts['info'],
+                       foreground=FG_PRIMARY,
+                       background=BG_SECONDARY)
+        
+        # Main window buttons: one style per size and color, e.g. Red.Primary.TButton;
+        # the theme handles hover/pressed shading through style.map
+        style.configure('Primary.TButton', font=self.fonts['primary'], padding=(10, 14))
+        style.configure('Secondary.TButton', font=self.fonts['heading'], padding=(5, 4))
+        for size in ('Primary', 'Secondary'):
+            for name, (color, active) in self.BUTTON_COLORS.items():
+                style_name = f'{name}.{size}.TButton'
+                style.configure(style_name, background=color, foreground='white')
+                style.map(style_name, background=[('pressed', active), ('active', active)])
     
     def setup_keybindings(self):
         """Setup keyboard/controller bindings"""
-        # Number keys for quick menu access
-        for i in range(1, 7):
-            self.root.bind(f'<Key-{i}>', lambda e, num=i: self.quick_action(num))
+        # Number keys for quick menu access, all through one handler
+        self.root.bind('<Key>', self.on_key)
         
         # Controller/gamepad bindings
         self.root.bind('<Return>', lambda e: self.launch_aprs())
@@ -83,14 +226,19 @@ class HamsterGUI:
         # Focus on root for key bindings
         self.root.focus_set()
         
+    def on_key(self, event):
+        """Dispatch number keys 1-6 to their quick actions"""
+        if len(event.keysym) == 1 and event.keysym in '123456':
+            self.quick_action(int(event.keysym))
+        
     def create_widgets(self):
         """Create and layout all GUI widgets"""
         # Main container
-        main_frame = tk.Frame(self.root, bg='#2c3e50')
+        main_frame = tk.Frame(self.root, bg=BG_PRIMARY)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Title section
-        title_frame = tk.Frame(main_frame, bg='#2c3e50')
+        title_frame = tk.Frame(main_frame, bg=BG_PRIMARY)
         title_frame.pack(fill=tk.X, pady=(0, 20))
         
         title_label = ttk.Label(title_frame, text="🔊 HAMSTER", style='Title.TLabel')
@@ -98,9 +246,9 @@ class HamsterGUI:
         
         subtitle_label = ttk.Label(title_frame, 
                                   text="Professional Amateur Radio Suite",
-                                  font=('Arial', 14),
+                                  font=self.fonts['subtitle'],
                                   foreground='#bdc3c7',
-                                  background='#2c3e50')
+                                  background=BG_PRIMARY)
         subtitle_label.pack()
         
         # Status section
@@ -118,8 +266,8 @@ class HamsterGUI:
     def create_status_section(self, parent):
         """Create system status display"""
         status_frame = tk.LabelFrame(parent, text="System Status", 
-                                   bg='#34495e', fg='#ecf0f1',
-                                   font=('Arial', 12, 'bold'))
+                                   bg=BG_SECONDARY, fg=FG_PRIMARY,
+                                   font=self.fonts['heading'])
         status_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Create status labels
@@ -133,152 +281,158 @@ class HamsterGUI:
             ('qsstv', 'QSSTV')
         ]
         
+        # Name and value labels sit directly in the frame's grid, two columns per item
         for i, (key, label) in enumerate(status_items):
             row = i // 3
-            col = i % 3
+            col = (i % 3) * 2
             
-            frame = tk.Frame(status_frame, bg='#34495e')
-            frame.grid(row=row, column=col, padx=10, pady=5, sticky='w')
+            tk.Label(status_frame, text=f"{label}:", bg=BG_SECONDARY, fg=FG_PRIMARY,
+                    font=self.fonts['body']).grid(row=row, column=col, padx=(10, 5),
+                                                  pady=5, sticky='w')
             
-            tk.Label(frame, text=f"{label}:", bg='#34495e', fg='#ecf0f1',
-                    font=('Arial', 10)).pack(side=tk.LEFT)
+            self.status_labels[key] = tk.Label(status_frame, text="Checking...", 
+                                             bg=BG_SECONDARY, fg='#f39c12',
+                                             font=self.fonts['body_bold'])
+            self.status_labels[key].grid(row=row, column=col + 1, padx=(0, 10),
+                                         pady=5, sticky='w')
             
-            self.status_labels[key] = tk.Label(frame, text="Checking...", 
-                                             bg='#34495e', fg='#f39c12',
-                                             font=('Arial', 10, 'bold'))
-            self.status_labels[key].pack(side=tk.LEFT, padx=(5, 0))
-            
-        # Configure grid weights
+        # Configure grid weights; spare width goes after each value
         for i in range(3):
-            status_frame.columnconfigure(i, weight=1)
+            status_frame.columnconfigure(i * 2 + 1, weight=1)
     
     def create_main_buttons(self, parent):
         """Create main application buttons"""
-        button_frame = tk.Frame(parent, bg='#2c3e50')
+        # One grid holds both rows; 12 columns let 3 primary buttons span 4 each
+        # and 4 secondary buttons span 3 each
+        button_frame = tk.Frame(parent, bg=BG_PRIMARY)
         button_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Main application buttons
         buttons = [
-            ("📻 APRS Chatty X", self.launch_aprs, '#e74c3c'),
-            ("📺 QSSTV", self.launch_qsstv, '#3498db'),
-            ("🔧 Settings", self.show_settings, '#f39c12'),
+            ("📻 APRS Chatty X", self.launch_aprs, 'Red'),
+            ("📺 QSSTV", self.launch_qsstv, 'Blue'),
+            ("🔧 Settings", self.show_settings, 'Orange'),
         ]
         
         for i, (text, command, color) in enumerate(buttons):
-            btn = tk.Button(button_frame, text=text, command=command,
-                          font=('Arial', 16, 'bold'),
-                          bg=color, fg='white',
-                          width=15, height=2,
-                          relief='raised', bd=3,
-                          activebackground=self.darken_color(color))
-            btn.grid(row=0, column=i, padx=10, pady=10)
-            
-        # Configure grid weights
-        for i in range(3):
-            button_frame.columnconfigure(i, weight=1)
+            btn = ttk.Button(button_frame, text=text, command=command,
+                           style=f'{color}.Primary.TButton',
+                           width=15)
+            btn.grid(row=0, column=i * 4, columnspan=4, padx=10, pady=(10, 30))
         
         # Secondary buttons
-        secondary_frame = tk.Frame(parent, bg='#2c3e50')
-        secondary_frame.pack(fill=tk.X, pady=(0, 20))
-        
         secondary_buttons = [
-            ("📋 Check Dependencies", self.check_dependencies, '#9b59b6'),
-            ("⬇️ Install Dependencies", self.install_dependencies, '#27ae60'),
-            ("ℹ️ System Info", self.show_system_info, '#34495e'),
-            ("❓ Help", self.show_help, '#7f8c8d')
+            ("📋 Check Dependencies", self.check_dependencies, 'Purple'),
+            ("⬇️ Install Dependencies", self.install_dependencies, 'Green'),
+            ("ℹ️ System Info", self.show_system_info, 'Slate'),
+            ("❓ Help", self.show_help, 'Gray')
         ]
         
         for i, (text, command, color) in enumerate(secondary_buttons):
-            btn = tk.Button(secondary_frame, text=text, command=command,
-                          font=('Arial', 12, 'bold'),
-                          bg=color, fg='white',
-                          width=18, height=1,
-                          relief='raised', bd=2)
-            btn.grid(row=0, column=i, padx=5, pady=5)
-            
-        for i in range(4):
-            secondary_frame.columnconfigure(i, weight=1)
+            btn = ttk.Button(button_frame, text=text, command=command,
+                           style=f'{color}.Secondary.TButton',
+                           width=18)
+            btn.grid(row=1, column=i * 3, columnspan=3, padx=5, pady=5)
+        
+        # Configure grid weights
+        for i in range(12):
+            button_frame.columnconfigure(i, weight=1)
     
     def create_system_info(self, parent):
         """Create system information display"""
         info_frame = tk.LabelFrame(parent, text="Quick Info", 
-                                 bg='#34495e', fg='#ecf0f1',
-                                 font=('Arial', 12, 'bold'))
+                                 bg=BG_SECONDARY, fg=FG_PRIMARY,
+                                 font=self.fonts['heading'])
         info_frame.pack(fill=tk.X, pady=(0, 20))
         
         self.info_label = tk.Label(info_frame, text="Loading system information...",
-                                  bg='#34495e', fg='#ecf0f1',
-                                  font=('Arial', 10),
+                                  bg=BG_SECONDARY, fg=FG_PRIMARY,
+                                  font=self.fonts['body'],
                                   justify=tk.LEFT)
         self.info_label.pack(anchor='w', padx=10, pady=5)
     
     def create_control_hints(self, parent):
         """Create controller/keyboard hints"""
-        hints_frame = tk.Frame(parent, bg='#2c3e50')
+        hints_frame = tk.Frame(parent, bg=BG_PRIMARY)
         hints_frame.pack(fill=tk.X)
         
         hints_text = "🎮 Controls: 1-APRS 2-QSSTV 3-Settings | Enter-Launch | F1-Help | F5-Refresh | Esc-Settings"
         hints_label = tk.Label(hints_frame, text=hints_text,
-                             bg='#2c3e50', fg='#7f8c8d',
-                             font=('Arial', 9))
+                             bg=BG_PRIMARY, fg='#7f8c8d',
+                             font=self.fonts['small'])
         hints_label.pack()
     
-    def darken_color(self, color):
-        """Darken a hex color for button active state"""
-        color_map = {
-            '#e74c3c': '#c0392b',
-            '#3498db': '#2980b9',
-            '#f39c12': '#d68910',
-            '#9b59b6': '#8e44ad',
-            '#27ae60': '#229954',
-            '#34495e': '#2c3e50',
-            '#7f8c8d': '#5d6d7e'
-        }
-        return color_map.get(color, '#2c3e50')
-    
     def check_system_status(self):
         """Check and update system status in background"""
-        def update_status():
-            try:
-                # Check SSH
-                ssh_status = subprocess.run(['systemctl', 'is-active', 'ssh'], 
-                                          capture_output=True, text=True).stdout.strip()
-                self.update_status_label('ssh', 'Active' if ssh_status == 'active' else 'Inactive')
-                
-                # Check Bluetooth
-                bt_status = subprocess.run(['systemctl', 'is-active', 'bluetooth'], 
-                                         capture_output=True, text=True).stdout.strip()
-                self.update_status_label('bluetooth', 'Active' if bt_status == 'active' else 'Inactive')
-                
-                # Check Network
-                try:
-                    ip = subprocess.run(['hostname', '-I'], capture_output=True, text=True).stdout.strip().split()[0]
-                    self.update_status_label('network', f"Connected ({ip})")
-                except:
-                    self.update_status_label('network', 'Disconnected')
-                
-                # Check Controller
-                controller_status = "Detected" if os.path.exists('/dev/input/js0') else "Not Found"
-                self.update_status_label('controller', controller_status)
-                
-                # Check Direwolf
-                direwolf_status = "Installed" if subprocess.run(['which', 'direwolf'], 
-                                                              capture_output=True).returncode == 0 else "Not Installed"
-                self.update_status_label('direwolf', direwolf_status)
-                
-                # Check QSSTV
-                qsstv_status = "Installed" if subprocess.run(['which', 'qsstv'], 
-                                                            capture_output=True).returncode == 0 else "Not Installed"
-                self.update_status_label('qsstv', qsstv_status)
-                
-                # Update system info
-                self.update_system_info()
-                
-            except Exception as e:
-                print(f"Error checking system status: {e}")
-        
-        # Run in background thread
-        threading.Thread(target=update_status, daemon=True).start()
+        # Rapid refreshes reuse the last probe instead of running it again
+        if self._status_cache and time.monotonic() - self._status_cache_ts < STATUS_CACHE_TTL:
+            self.apply_status(self._status_cache)
+            return
+        
+        # A probe is already running; its results will be shown when it ends
+        if self._status_probe is not None:
+            return
+        
+        # In-process figures first; only shell out for the IP if they have none
+        self._status_info = gather_system_info()
+        script = STATUS_SCRIPT
+        if not self._status_info['ip']:
+            script += IP_FALLBACK_SCRIPT
+        
+        try:
+            self._status_probe = subprocess.Popen(['bash', '-c', script],
+                                                  stdout=subprocess.PIPE,
+                                                  stdin=subprocess.DEVNULL,
+                                                  stderr=subprocess.DEVNULL,
+                                                  text=True)
+        except Exception as e:
+            print(f"Error checking system status: {e}")
+            return
+        
+        # Poll from the Tk event loop so labels are only touched on the main thread
+        self.root.after(50, self.poll_status_probe)
+    
+    def poll_status_probe(self):
+        """Collect the status probe output once the shell has finished"""
+        proc = self._status_probe
+        if proc.poll() is None:
+            self.root.after(50, self.poll_status_probe)
+            return
+        
+        self._status_probe = None
+        status = dict(self._status_info)
+        for line in proc.stdout.read().splitlines():
+            key, _, value = line.partition('=')
+            status[key] = value.strip()
+        proc.stdout.close()
+        
+        # hostname -I lists every address; show the first one
+        if status['ip']:
+            status['ip'] = status['ip'].split()[0]
+        self.apply_status(status)
+    
+    def apply_status(self, status):
+        """Show the results of a status probe"""
+        if status is not self._status_cache:
+            self._status_cache = status
+            self._status_cache_ts = time.monotonic()
+        
+        self.update_status_label('ssh', 'Active' if status.get('ssh') == 'active' else 'Inactive')
+        self.update_status_label('bluetooth', 'Active' if status.get('bluetooth') == 'active' else 'Inactive')
+        
+        ip = status.get('ip')
+        self.update_status_label('network', f"Connected ({ip})" if ip else 'Disconnected')
+        
+        # Check Controller
+        controller_status = "Detected" if os.path.exists('/dev/input/js0') else "Not Found"
+        self.update_status_label('controller', controller_status)
+        
+        # Check applications ($PATH lookup in-process)
+        self.update_status_label('direwolf', "Installed" if find_executable('direwolf') else "Not Installed")
+        self.update_status_label('qsstv', "Installed" if find_executable('qsstv') else "Not Installed")
+        
+        # Update system info
+        self.update_system_info(status)
     
     def update_status_label(self, key, status):
         """Update status label with color coding"""
@@ -288,21 +442,12 @@ class HamsterGUI:
                 color = '#27ae60'
             self.status_labels[key].config(text=status, fg=color)
     
-    def update_system_info(self):
+    def update_system_info(self, status):
         """Update system information display"""
-        try:
-            # Get system info
-            uname = subprocess.run(['uname', '-r'], capture_output=True, text=True).stdout.strip()
-            arch = subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()
-            
-            # Get disk space
-            df_output = subprocess.run(['df', '-h', '.'], capture_output=True, text=True).stdout.split('\n')[1]
-            available = df_output.split()[3]
-            
-            info_text = f"Kernel: {uname} | Architecture: {arch} | Available: {available}"
+        if status.get('disk'):
+            info_text = f"Kernel: {status['kernel']} | Architecture: {status['arch']} | Available: {status['disk']}"
             self.info_label.config(text=info_text)
-            
-        except Exception as e:
+        else:
             self.info_label.config(text="System info unavailable")
     
     def quick_action(self, num):
@@ -321,7 +466,7 @@ class HamsterGUI:
     
     def launch_aprs(self):
         """Launch APRS Chatty X"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', 'launch_aprs_chatty_x.sh')
+        script_path = os.path.join(SCRIPTS_DIR, 'launch_aprs_chatty_x.sh')
         try:
             subprocess.Popen(['bash', script_path], start_new_session=True)
             messagebox.showinfo("APRS Chatty X", "Launching APRS Chatty X...")
@@ -330,7 +475,7 @@ class HamsterGUI:
     
     def launch_qsstv(self):
         """Launch QSSTV"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', 'launch_qsstv.sh')
+        script_path = os.path.join(SCRIPTS_DIR, 'launch_qsstv.sh')
         try:
             subprocess.Popen(['bash', script_path], start_new_session=True)
             messagebox.showinfo("QSSTV", "Launching QSSTV...")
@@ -339,7 +484,7 @@ class HamsterGUI:
     
     def show_settings(self):
         """Show settings dialog"""
-        SettingsWindow(self.root)
+        SettingsWindow(self.root, self.fonts)
     
     def check_dependencies(self):
         """Run dependency checker"""
@@ -356,7 +501,7 @@ class HamsterGUI:
     
     def show_system_info(self):
         """Show detailed system information"""
-        SystemInfoWindow(self.root)
+        SystemInfoWindow(self.root, self.fonts)
     
     def show_help(self):
         """Show help dialog"""
@@ -388,17 +533,18 @@ For more information, visit the documentation.
     
     def refresh_status(self):
         """Refresh system status"""
+        # Applications may have been installed since the last lookup
+        find_executable.cache_clear()
         self.check_system_status()
         messagebox.showinfo("Refresh", "System status refreshed!")
     
     def run_script_in_terminal(self, script_name, title):
         """Run a script in a terminal window"""
-        script_path = os.path.join(os.path.dirname(__file__), 'scripts', script_name)
+        script_path = os.path.join(SCRIPTS_DIR, script_name)
         try:
             # Try different terminal emulators
-            terminals = ['x-terminal-emulator', 'gnome-terminal', 'xterm', 'konsole']
-            for terminal in terminals:
-                if subprocess.run(['which', terminal], capture_output=True).returncode == 0:
+            for terminal in TERMINALS:
+                if find_executable(terminal):
                     subprocess.Popen([terminal, '-e', f'bash {script_path}; read -p "Press Enter to close..."'])
                     break
             else:
@@ -412,11 +558,12 @@ For more information, visit the documentation.
 
 
 class SettingsWindow:
-    def __init__(self, parent):
+    def __init__(self, parent, fonts):
+        self.fonts = fonts
         self.window = tk.Toplevel(parent)
         self.window.title("Hamster Settings")
         self.window.geometry("600x400")
-        self.window.configure(bg='#2c3e50')
+        self.window.configure(bg=BG_PRIMARY)
         self.window.grab_set()  # Modal dialog
         
         self.create_settings_widgets()
@@ -425,88 +572,92 @@ class SettingsWindow:
         """Create settings interface"""
         # Title
         title = tk.Label(self.window, text="System Settings", 
-                        font=('Arial', 18, 'bold'),
-                        bg='#2c3e50', fg='#ecf0f1')
+                        font=self.fonts['window_title'],
+                        bg=BG_PRIMARY, fg=FG_PRIMARY)
         title.pack(pady=20)
         
         # Settings notebook
         notebook = ttk.Notebook(self.window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        # Network tab
-        network_frame = tk.Frame(notebook, bg='#34495e')
-        notebook.add(network_frame, text="Network")
-        self.create_network_settings(network_frame)
-        
-        # Audio tab
-        audio_frame = tk.Frame(notebook, bg='#34495e')
-        notebook.add(audio_frame, text="Audio")
-        self.create_audio_settings(audio_frame)
-        
-        # Ham Radio tab
-        ham_frame = tk.Frame(notebook, bg='#34495e')
-        notebook.add(ham_frame, text="Ham Radio")
-        self.create_ham_settings(ham_frame)
+        # Tabs start empty and are filled the first time they are selected
+        self._tab_builders = {}
+        for text, builder in (("Network", self.create_network_settings),
+                              ("Audio", self.create_audio_settings),
+                              ("Ham Radio", self.create_ham_settings)):
+            frame = tk.Frame(notebook, bg=BG_SECONDARY)
+            notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = builder
+        
+        self.on_tab_changed(notebook)
+        notebook.bind('<<NotebookTabChanged>>', lambda e: self.on_tab_changed(e.widget))
+    
+    def on_tab_changed(self, notebook):
+        """Build the selected tab's widgets if this is its first showing"""
+        tab = notebook.select()
+        builder = self._tab_builders.pop(tab, None)
+        if builder:
+            builder(notebook.nametowidget(tab))
     
     def create_network_settings(self, parent):
         """Create network settings"""
         tk.Label(parent, text="Network Configuration", 
-                font=('Arial', 14, 'bold'),
-                bg='#34495e', fg='#ecf0f1').pack(pady=10)
+                font=self.fonts['section'],
+                bg=BG_SECONDARY, fg=FG_PRIMARY).pack(pady=10)
         
         # SSH button
         tk.Button(parent, text="Enable SSH Permanently",
                  command=self.enable_ssh,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#27ae60', fg='white').pack(pady=5)
         
         # WiFi button
         tk.Button(parent, text="Enable WiFi Permanently",
                  command=self.enable_wifi,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#3498db', fg='white').pack(pady=5)
         
         # Bluetooth button
         tk.Button(parent, text="Configure Bluetooth",
                  command=self.configure_bluetooth,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#9b59b6', fg='white').pack(pady=5)
     
     def create_audio_settings(self, parent):
         """Create audio settings"""
         tk.Label(parent, text="Audio Configuration", 
-                font=('Arial', 14, 'bold'),
-                bg='#34495e', fg='#ecf0f1').pack(pady=10)
+                font=self.fonts['section'],
+                bg=BG_SECONDARY, fg=FG_PRIMARY).pack(pady=10)
         
         tk.Button(parent, text="Audio Device Selection",
                  command=self.configure_audio,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#f39c12', fg='white').pack(pady=5)
         
         tk.Button(parent, text="Test Audio Devices",
                  command=self.test_audio,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#e67e22', fg='white').pack(pady=5)
     
     def create_ham_settings(self, parent):
         """Create ham radio settings"""
         tk.Label(parent, text="Amateur Radio Station", 
-                font=('Arial', 14, 'bold'),
-                bg='#34495e', fg='#ecf0f1').pack(pady=10)
+                font=self.fonts['section'],
+                bg=BG_SECONDARY, fg=FG_PRIMARY).pack(pady=10)
         
         # Callsign entry
-        callsign_frame = tk.Frame(parent, bg='#34495e')
+        callsign_frame = tk.Frame(parent, bg=BG_SECONDARY)
         callsign_frame.pack(pady=10)
         
         tk.Label(callsign_frame, text="Callsign:", 
-                bg='#34495e', fg='#ecf0f1').pack(side=tk.LEFT)
+                bg=BG_SECONDARY, fg=FG_PRIMARY).pack(side=tk.LEFT)
         
-        self.callsign_entry = tk.Entry(callsign_frame, font=('Arial', 12))
+        self.callsign_entry = tk.Entry(callsign_frame, font=self.fonts['button'])
         self.callsign_entry.pack(side=tk.LEFT, padx=10)
         
         tk.Button(parent, text="Save Station Settings",
                  command=self.save_ham_settings,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#27ae60', fg='white').pack(pady=10)
     
     def enable_ssh(self):
@@ -537,9 +688,16 @@ class SettingsWindow:
     
     def test_audio(self):
         """Test audio devices"""
+        # Playback runs in the background so the window stays responsive
         try:
-            subprocess.run(['aplay', '/usr/share/sounds/alsa/Front_Left.wav'], check=True)
-            messagebox.showinfo("Audio Test", "Audio test completed!")
+            if not os.path.exists(TEST_SOUND):
+                raise FileNotFoundError(TEST_SOUND)
+            if simpleaudio:
+                self.test_playback = simpleaudio.WaveObject.from_wave_file(TEST_SOUND).play()
+            else:
+                subprocess.Popen(['aplay', '-q', TEST_SOUND], stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            messagebox.showinfo("Audio Test", "Playing test sound...")
         except:
             messagebox.showwarning("Audio Test", "Audio test failed or no test sounds available")
     
@@ -554,11 +712,12 @@ class SettingsWindow:
 
 
 class SystemInfoWindow:
-    def __init__(self, parent):
+    def __init__(self, parent, fonts):
+        self.fonts = fonts
         self.window = tk.Toplevel(parent)
         self.window.title("System Information")
         self.window.geometry("500x400")
-        self.window.configure(bg='#2c3e50')
+        self.window.configure(bg=BG_PRIMARY)
         self.window.grab_set()
         
         self.create_info_display()
@@ -566,28 +725,32 @@ class SystemInfoWindow:
     def create_info_display(self):
         """Create system info display"""
         title = tk.Label(self.window, text="System Information", 
-                        font=('Arial', 16, 'bold'),
-                        bg='#2c3e50', fg='#ecf0f1')
+                        font=self.fonts['primary'],
+                        bg=BG_PRIMARY, fg=FG_PRIMARY)
         title.pack(pady=10)
         
         # Scrollable text area
-        text_frame = tk.Frame(self.window, bg='#2c3e50')
+        text_frame = tk.Frame(self.window, bg=BG_PRIMARY)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        self.info_text = tk.Text(text_frame, bg='#34495e', fg='#ecf0f1',
-                                font=('Monaco', 10), wrap=tk.WORD)
+        # Read-only dump: no undo history, and only writable inside append_info
+        self.info_text = tk.Text(text_frame, bg=BG_SECONDARY, fg=FG_PRIMARY,
+                                font=self.fonts['mono'], wrap=tk.WORD,
+                                undo=False, maxundo=0, autoseparators=False,
+                                state=tk.DISABLED)
         scrollbar = tk.Scrollbar(text_frame, command=self.info_text.yview)
         self.info_text.config(yscrollcommand=scrollbar.set)
         
         self.info_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.load_system_info()
+        # Let the window paint before running the slower probes
+        self.window.after(10, self.load_system_info)
         
         # Close button
         tk.Button(self.window, text="Close",
                  command=self.window.destroy,
-                 font=('Arial', 12),
+                 font=self.fonts['button'],
                  bg='#7f8c8d', fg='white').pack(pady=10)
     
     def load_system_info(self):
@@ -597,8 +760,10 @@ class SystemInfoWindow:
         
         try:
             # Basic system info
-            info += f"Kernel: {subprocess.run(['uname', '-r'], capture_output=True, text=True).stdout.strip()}\n"
-            info += f"Architecture: {subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()}\n"
+            system = gather_system_info()
+            info += f"Kernel: {system['kernel']}\n"
+            info += f"Architecture: {system['arch']}\n"
+            info += f"IP Address: {system['ip'] or 'Not connected'}\n"
             
             # OS info
             try:
@@ -623,23 +788,67 @@ class SystemInfoWindow:
             except:
                 info += "Memory: Unknown\n"
             
-            # Disk space
-            df_output = subprocess.run(['df', '-h'], capture_output=True, text=True).stdout
-            info += f"\nDISK SPACE:\n{df_output}\n"
-            
-            # Network interfaces
-            ip_output = subprocess.run(['ip', 'addr'], capture_output=True, text=True).stdout
-            info += f"\nNETWORK INTERFACES:\n{ip_output}\n"
-            
-            # USB devices
-            lsusb_output = subprocess.run(['lsusb'], capture_output=True, text=True).stdout
-            info += f"\nUSB DEVICES:\n{lsusb_output}\n"
-            
         except Exception as e:
             info += f"Error loading system info: {e}\n"
         
-        self.info_text.insert(tk.END, info)
+        self.append_info(info)
+        
+        # Longer command listings are streamed in one after another
+        self.pending_sections = [
+            ("DISK SPACE", ['df', '-h']),
+            ("NETWORK INTERFACES", ['ip', 'addr']),
+            ("USB DEVICES", ['lsusb'])
+        ]
+        self.start_next_section()
+    
+    def append_info(self, text):
+        """Append text to the read-only info display"""
+        self.info_text.config(state=tk.NORMAL)
+        self.info_text.insert(tk.END, text)
         self.info_text.config(state=tk.DISABLED)
+    
+    def start_next_section(self):
+        """Start the command for the next pending section, if any"""
+        if not self.pending_sections:
+            return
+        
+        title, command = self.pending_sections.pop(0)
+        self.append_info(f"\n{title}:\n")
+        try:
+            proc = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                    stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            self.append_info("Unavailable\n")
+            self.start_next_section()
+            return
+        
+        os.set_blocking(proc.stdout.fileno(), False)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self.window.after(20, self.poll_section, proc, decoder)
+    
+    def poll_section(self, proc, decoder):
+        """Copy whatever output is ready into the display, then check again"""
+        try:
+            data = os.read(proc.stdout.fileno(), 65536)
+        except BlockingIOError:
+            data = None
+        
+        try:
+            if data:
+                self.append_info(decoder.decode(data))
+            elif data == b'':
+                # End of output: finish this section and move on
+                proc.stdout.close()
+                proc.wait()
+                self.append_info(decoder.decode(b'', final=True) + "\n")
+                self.start_next_section()
+                return
+            self.window.after(20, self.poll_section, proc, decoder)
+        except tk.TclError:
+            # Window was closed while the command was still running
+            proc.kill()
+            proc.stdout.close()
+            proc.wait()
 
 
 def main():